@@ -0,0 +1,40 @@
+"""
+Ahead-of-time build of the LBO numeric kernels
+
+Compiles the single-deal debt cascade and operating kernels from lbo_model into
+a native `lbo_kernels` extension module with Numba's pycc. lbo_model picks the
+module up automatically when it is importable, so single-deal runs skip JIT
+compilation entirely.
+
+The build records a fingerprint of the kernel source; lbo_model ignores a build
+that no longer matches, so rerun this script after editing the kernels.
+
+Usage:
+    python lbo_kernels_aot.py
+"""
+
+import os
+
+# Import the kernels as plain Python functions for pycc to compile
+os.environ['LBO_USE_NUMBA'] = '0'
+
+from numba.pycc import CC
+import lbo_model
+
+cc = CC('lbo_kernels')
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+cc.export('debt_cascade', 'f8[:,:,:](f8[:], f8[:], f8[:], f8[:])')(lbo_model._debt_cascade_kernel)
+cc.export('operating', 'f8[:,:,:](f8[:,:], f8[:], f8[:], f8[:], f8[:], f8[:])')(lbo_model._operating_kernel)
+
+KERNEL_SOURCE_HASH = lbo_model._kernel_source_hash()
+
+
+@cc.export('source_hash', 'i8()')
+def source_hash():
+    return KERNEL_SOURCE_HASH
+
+
+if __name__ == "__main__":
+    cc.compile()
+    print(f"Built lbo_kernels in {cc.output_dir}")
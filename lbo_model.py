@@ -8,14 +8,216 @@ Based on experience at BNP Paribas Corporate & Investment Banking
 
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import plotly.graph_objects as go
-import plotly.express as px
-from plotly.subplots import make_subplots
 from datetime import datetime
+import os
+import functools
+import inspect
+import zlib
 import warnings
 warnings.filterwarnings('ignore')
 
+try:
+    import numexpr
+except ImportError:
+    numexpr = None
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
+
+try:
+    import lbo_kernels  # native build produced by `python lbo_kernels_aot.py`
+except ImportError:
+    lbo_kernels = None
+
+# JIT-compile the numeric kernels when Numba is installed; set LBO_USE_NUMBA=0
+# before import to run them as plain NumPy and skip compilation entirely
+USE_NUMBA = njit is not None and os.environ.get('LBO_USE_NUMBA', '1') != '0'
+
+
+def _jit(func=None, parallel=False):
+    """
+    Compile a kernel with Numba (cached, fastmath) on first call if USE_NUMBA, else leave it as Python
+    """
+    def decorate(func):
+        if not USE_NUMBA:
+            return func
+        return njit(cache=True, fastmath=True, parallel=parallel)(func)
+    return decorate(func) if func is not None else decorate
+
+# Field order of the last axis returned by _debt_cascade_kernel
+DEBT_SCHEDULE_FIELDS = ['beginning_balance', 'mandatory_payment', 'optional_payment',
+                        'total_payment', 'interest_payment', 'ending_balance']
+
+# Position of Term Loan B, the only tranche prepaid from excess cash
+TLB_INDEX = 1
+
+# Sensitivity grids at least this large are evaluated with numexpr when available
+NUMEXPR_MIN_CELLS = 10_000
+
+# Simplified debt reduction: interest base shrinks 10% a year (Year 1 = 1.0)
+DEBT_REDUCTION_FACTORS = 0.9 ** np.arange(5)
+
+# Metric order of the first axis returned by _operating_kernel
+OPERATING_METRICS = ['revenue', 'ebitda', 'ebit', 'depreciation', 'interest_expense', 'ebt',
+                     'taxes', 'net_income', 'operating_cash_flow', 'capex', 'nwc_change',
+                     'free_cash_flow']
+
+
+@functools.lru_cache(maxsize=256)
+def _growth_factors(revenue_growth):
+    """
+    Cumulative revenue multipliers for Years 1-5 from a tuple of growth rates
+    
+    Growth beyond the supplied rates holds at the last rate. The returned array
+    is cached and shared between calls, so it is read-only
+    """
+    growth = np.asarray(revenue_growth, dtype=float)
+    growth = np.concatenate((growth, np.repeat(growth[-1], max(0, 4 - len(growth)))))[:4]
+    factors = np.concatenate(([1.0], np.cumprod(1 + growth)))
+    factors.setflags(write=False)
+    return factors
+
+
+@_jit
+def _operating_kernel(revenue, ebitda_margin, capex_rate, nwc_rate, tax_rate, interest_base):
+    """
+    Derive P&L and cash flow lines from projected revenue
+    
+    revenue has shape (scenarios, years); every other input is a per-scenario
+    array. Returns an array of shape (len(OPERATING_METRICS), scenarios, years)
+    """
+    # P&L calculations
+    ebitda = revenue * ebitda_margin[:, None]
+    depreciation = revenue * 0.03  # Assume 3% depreciation rate
+    ebit = ebitda - depreciation
+    
+    # Interest expense (simplified - based on average debt outstanding)
+    # Assume debt paydown reduces interest expense over time
+    interest_expense = interest_base[:, None] * DEBT_REDUCTION_FACTORS[None, :]
+    
+    # Tax calculations
+    ebt = ebit - interest_expense
+    taxes = np.maximum(0.0, ebt * tax_rate[:, None])
+    net_income = ebt - taxes
+    
+    # Cash flow calculations
+    operating_cash_flow = net_income + depreciation
+    capex = revenue * capex_rate[:, None]
+    
+    # Working capital change (no change in year 1)
+    nwc_change = np.zeros_like(revenue)
+    nwc_change[:, 1:] = (revenue[:, 1:] - revenue[:, :-1]) * nwc_rate[:, None]
+    
+    free_cash_flow = operating_cash_flow - capex - nwc_change
+    
+    return np.stack((revenue, ebitda, ebit, depreciation, interest_expense, ebt,
+                     taxes, net_income, operating_cash_flow, capex, nwc_change,
+                     free_cash_flow))
+
+
+@_jit
+def _debt_cascade_kernel(amounts, rates, amort, fcf):
+    """
+    Run the year-by-year cash sweep across debt tranches
+    
+    Returns an array of shape (years, tranches, len(DEBT_SCHEDULE_FIELDS))
+    """
+    n_years = fcf.shape[0]
+    n_tranches = amounts.shape[0]
+    balances = amounts.copy()
+    out = np.empty((n_years, n_tranches, 6))
+    
+    for y in range(n_years):
+        remaining_cash = fcf[y]
+        
+        for t in range(n_tranches):
+            beginning_balance = balances[t]
+            
+            # Mandatory amortization
+            mandatory_payment = min(beginning_balance * amort[t], beginning_balance)
+            
+            # Optional prepayment from excess cash (TLB only)
+            optional_payment = 0.0
+            if t == TLB_INDEX and remaining_cash > mandatory_payment:
+                available_cash = remaining_cash - mandatory_payment
+                optional_payment = min(available_cash, beginning_balance - mandatory_payment)
+            
+            total_payment = mandatory_payment + optional_payment
+            ending_balance = beginning_balance - total_payment
+            if ending_balance < 0.0:
+                ending_balance = 0.0
+            
+            out[y, t, 0] = beginning_balance
+            out[y, t, 1] = mandatory_payment
+            out[y, t, 2] = optional_payment
+            out[y, t, 3] = total_payment
+            out[y, t, 4] = beginning_balance * rates[t]
+            out[y, t, 5] = ending_balance
+            
+            # Update remaining cash and debt balance
+            remaining_cash -= total_payment
+            balances[t] = ending_balance
+    
+    return out
+
+
+@_jit(parallel=True)
+def _batch_lbo_kernel(amounts, rates, amort, fcf, exit_ebitda, sponsor_equity, multiples, exit_year):
+    """
+    Run the debt cascade and exit returns for every scenario
+    
+    amounts and fcf are (scenarios, tranches) and (scenarios, years); rates and
+    amort are shared across scenarios. Returns remaining debt at exit (scenarios,)
+    plus MOIC and IRR arrays of shape (scenarios, multiples). Scenarios are
+    independent, so they are spread across cores with prange
+    """
+    n_scenarios = amounts.shape[0]
+    n_multiples = multiples.shape[0]
+    exponent = 1.0 / exit_year
+    remaining_debt = np.empty(n_scenarios)
+    moic = np.empty((n_scenarios, n_multiples))
+    irr = np.empty((n_scenarios, n_multiples))
+    
+    for i in prange(n_scenarios):
+        cascade = _debt_cascade_kernel(amounts[i], rates, amort, fcf[i])
+        remaining_debt[i] = cascade[exit_year - 1, :, 5].sum()  # ending_balance
+        
+        for j in range(n_multiples):
+            equity_value = exit_ebitda[i] * multiples[j] - remaining_debt[i]
+            if equity_value < 0.0:
+                equity_value = 0.0
+            moic[i, j] = equity_value / sponsor_equity[i] if sponsor_equity[i] > 0 else 0.0
+            irr[i, j] = moic[i, j] ** exponent - 1 if moic[i, j] > 0 else -1.0
+    
+    return remaining_debt, moic, irr
+
+
+def _kernel_source_hash():
+    """
+    Fingerprint of the ahead-of-time exported kernels and the constants they bake in
+    """
+    source = ''.join(
+        inspect.getsource(getattr(kernel, 'py_func', kernel))
+        for kernel in (_debt_cascade_kernel, _operating_kernel)
+    )
+    source += repr(TLB_INDEX) + repr(DEBT_REDUCTION_FACTORS.tolist())
+    return zlib.crc32(source.encode())
+
+
+# Single-deal kernels: prefer the ahead-of-time build, which runs without any JIT.
+# A build made from older kernel source no longer matches and is ignored.
+_aot_source_hash = getattr(lbo_kernels, 'source_hash', None)
+if _aot_source_hash is not None and _aot_source_hash() == _kernel_source_hash():
+    _debt_cascade = lbo_kernels.debt_cascade
+    _operating = lbo_kernels.operating
+else:
+    _debt_cascade = _debt_cascade_kernel
+    _operating = _operating_kernel
+
+
 class LBOAnalysis:
     """
     Comprehensive LBO financial model for private equity transactions
@@ -28,7 +230,27 @@ class LBOAnalysis:
     - Sensitivity analysis and risk assessment
     """
     
-    def __init__(self, company_name, purchase_price, sponsor_equity):
+    # Standard tranche terms, in tranche order
+    TRANCHE_NAMES = ['Term Loan A', 'Term Loan B', 'Revolver', 'Subordinated Debt']
+    _TRANCHE_RATES = np.array([
+        0.045,  # TLA: L+400bps (assuming 4.5% all-in)
+        0.065,  # TLB: L+650bps (assuming 6.5% all-in)
+        0.035,  # Revolver: L+350bps (assuming 3.5% all-in)
+        0.085   # Subordinated: 8.5% fixed rate
+    ])
+    _TRANCHE_TERMS = np.array([7, 8, 5, 10], dtype=float)
+    _TRANCHE_AMORTIZATION = np.array([
+        0.15,   # TLA: 15% annual mandatory amortization
+        0.01,   # TLB: 1% annual mandatory amortization
+        0.0,    # Revolving facility
+        0.0     # Bullet maturity
+    ])
+    _TRANCHE_SENIORITY = np.array([1, 2, 1, 3], dtype=float)
+    
+    # Projection years
+    _YEARS = np.arange(1, 6)
+    
+    def __init__(self, company_name, purchase_price, sponsor_equity, verbose=True):
         """
         Initialize LBO analysis
         
@@ -36,67 +258,78 @@ class LBOAnalysis:
         company_name (str): Target company name
         purchase_price (float): Total enterprise value (€M)
         sponsor_equity (float): PE sponsor equity contribution (€M)
+        verbose (bool): Print summaries as the model is built (disable for batch runs)
         """
         self.company_name = company_name
         self.purchase_price = purchase_price
         self.sponsor_equity = sponsor_equity
         self.total_debt = purchase_price - sponsor_equity
+        self.verbose = verbose
         
         # Initialize data structures
         self.debt_structure = {}
-        self.operating_model = {}
+        self.debt_tranche_names = []
+        self.debt_amounts = np.zeros(0)
+        self.debt_rates = np.zeros(0)
+        self.debt_terms = np.zeros(0)
+        self.debt_amortization = np.zeros(0)
+        self.debt_seniority = np.zeros(0)
+        self.operating_model = pd.DataFrame()
         self.debt_schedule = {}
+        self.remaining_debt_by_year = np.zeros(0)
+        self.debt_schedule_frame = pd.DataFrame()
         self.returns_analysis = {}
         
-        print(f"Initialized LBO Analysis for {company_name}")
-        print(f"Purchase Price: €{purchase_price:,.0f}M")
-        print(f"Sponsor Equity: €{sponsor_equity:,.0f}M") 
-        print(f"Total Debt: €{self.total_debt:,.0f}M")
+        # Blended debt terms, cached by structure_debt
+        self._total_debt_amount = 0
+        self._weighted_avg_rate = 0
+        
+        if self.verbose:
+            print(f"Initialized LBO Analysis for {company_name}")
+            print(f"Purchase Price: €{purchase_price:,.0f}M")
+            print(f"Sponsor Equity: €{sponsor_equity:,.0f}M") 
+            print(f"Total Debt: €{self.total_debt:,.0f}M")
     
     def structure_debt(self, term_loan_a=0, term_loan_b=0, revolver=0, subordinated=0):
         """
         Structure multi-tranche debt facility
         
-        Parameters represent debt amounts in €M
+        Parameters represent debt amounts in €M. The debt_* arrays set here are the
+        source of truth for the model; the returned debt_structure dict is a snapshot
         """
+        self.debt_tranche_names = list(self.TRANCHE_NAMES)
+        self.debt_amounts = np.array([term_loan_a, term_loan_b, revolver, subordinated], dtype=float)
+        self.debt_rates = self._TRANCHE_RATES.copy()
+        self.debt_terms = self._TRANCHE_TERMS.copy()
+        self.debt_amortization = self._TRANCHE_AMORTIZATION.copy()
+        self.debt_seniority = self._TRANCHE_SENIORITY.copy()
+        
+        # Read-only snapshot of the arrays above for display and callers; the
+        # model reads the debt_* arrays, so edits here do not change results
         self.debt_structure = {
-            'Term Loan A': {
-                'amount': term_loan_a,
-                'rate': 0.045,  # L+400bps (assuming 4.5% all-in)
-                'term': 7,
-                'amortization': 0.15,  # 15% annual mandatory amortization
-                'seniority': 1
-            },
-            'Term Loan B': {
-                'amount': term_loan_b, 
-                'rate': 0.065,  # L+650bps (assuming 6.5% all-in)
-                'term': 8,
-                'amortization': 0.01,  # 1% annual mandatory amortization
-                'seniority': 2
-            },
-            'Revolver': {
-                'amount': revolver,
-                'rate': 0.035,  # L+350bps (assuming 3.5% all-in) 
-                'term': 5,
-                'amortization': 0.0,   # Revolving facility
-                'seniority': 1
-            },
-            'Subordinated Debt': {
-                'amount': subordinated,
-                'rate': 0.085,  # 8.5% fixed rate
-                'term': 10,
-                'amortization': 0.0,   # Bullet maturity
-                'seniority': 3
+            name: {
+                'amount': self.debt_amounts[t],
+                'rate': self.debt_rates[t],
+                'term': int(self.debt_terms[t]),
+                'amortization': self.debt_amortization[t],
+                'seniority': int(self.debt_seniority[t])
             }
+            for t, name in enumerate(self.debt_tranche_names)
         }
         
-        total_debt_check = sum([tranche['amount'] for tranche in self.debt_structure.values()])
-        print(f"\nDebt Structure (€M):")
-        print("-" * 40)
-        for tranche_name, details in self.debt_structure.items():
-            if details['amount'] > 0:
-                print(f"{tranche_name}: €{details['amount']:,.0f}M at {details['rate']:.1%}")
-        print(f"Total Debt: €{total_debt_check:,.0f}M")
+        self._total_debt_amount = self.debt_amounts.sum()
+        self._weighted_avg_rate = (
+            self.debt_amounts @ self.debt_rates / self._total_debt_amount
+            if self._total_debt_amount > 0 else 0
+        )
+        
+        if self.verbose:
+            print(f"\nDebt Structure (€M):")
+            print("-" * 40)
+            for t, tranche_name in enumerate(self.debt_tranche_names):
+                if self.debt_amounts[t] > 0:
+                    print(f"{tranche_name}: €{self.debt_amounts[t]:,.0f}M at {self.debt_rates[t]:.1%}")
+            print(f"Total Debt: €{self._total_debt_amount:,.0f}M")
         
         return self.debt_structure
     
@@ -113,78 +346,29 @@ class LBOAnalysis:
         nwc_rate (float): NWC increase as % of revenue growth
         tax_rate (float): Tax rate on EBT
         """
-        years = [1, 2, 3, 4, 5]
-        model = {}
-        
-        for i, year in enumerate(years):
-            # Revenue projections
-            if year == 1:
-                revenue = base_revenue
-            else:
-                growth_rate = revenue_growth[i-1] if i-1 < len(revenue_growth) else revenue_growth[-1]
-                revenue = model[year-1]['revenue'] * (1 + growth_rate)
-            
-            # P&L calculations
-            ebitda = revenue * ebitda_margin
-            depreciation = revenue * 0.03  # Assume 3% depreciation rate
-            ebit = ebitda - depreciation
-            
-            # Interest expense (simplified - based on average debt outstanding)
-            if self.debt_structure:
-                total_debt_amount = sum([debt['amount'] for debt in self.debt_structure.values()])
-                weighted_avg_rate = sum([
-                    debt['amount'] * debt['rate'] 
-                    for debt in self.debt_structure.values()
-                ]) / total_debt_amount if total_debt_amount > 0 else 0
-                
-                # Assume debt paydown reduces interest expense over time
-                debt_reduction_factor = 0.9 ** (year - 1)  # Simplified debt reduction
-                interest_expense = total_debt_amount * weighted_avg_rate * debt_reduction_factor
-            else:
-                interest_expense = 0
-            
-            # Tax calculations
-            ebt = ebit - interest_expense
-            taxes = max(0, ebt * tax_rate)
-            net_income = ebt - taxes
-            
-            # Cash flow calculations
-            operating_cash_flow = net_income + depreciation
-            capex = revenue * capex_rate
-            
-            # Working capital change
-            if year == 1:
-                nwc_change = 0
-            else:
-                revenue_change = revenue - model[year-1]['revenue']
-                nwc_change = revenue_change * nwc_rate
-            
-            free_cash_flow = operating_cash_flow - capex - nwc_change
-            
-            # Store results
-            model[year] = {
-                'revenue': revenue,
-                'ebitda': ebitda,
-                'ebit': ebit,
-                'depreciation': depreciation,
-                'interest_expense': interest_expense,
-                'ebt': ebt,
-                'taxes': taxes,
-                'net_income': net_income,
-                'operating_cash_flow': operating_cash_flow,
-                'capex': capex,
-                'nwc_change': nwc_change,
-                'free_cash_flow': free_cash_flow
-            }
+        # Revenue projections
+        revenue = base_revenue * _growth_factors(tuple(revenue_growth))
+        
+        values = _operating(
+            revenue[None, :],
+            np.full(1, ebitda_margin, dtype=float),
+            np.full(1, capex_rate, dtype=float),
+            np.full(1, nwc_rate, dtype=float),
+            np.full(1, tax_rate, dtype=float),
+            np.full(1, self._total_debt_amount * self._weighted_avg_rate, dtype=float)
+        )
         
+        # Store results as a (year x metric) table
+        model = pd.DataFrame(values[:, 0].T, index=pd.Index(self._YEARS, name='year'), columns=OPERATING_METRICS)
         self.operating_model = model
         
         # Display summary
-        print(f"\nOperating Model Summary (€M):")
-        print("-" * 50)
-        print("Year\tRevenue\tEBITDA\tFree CF")
-        for year, data in model.items():
-            print(f"{year}\t€{data['revenue']:.0f}M\t€{data['ebitda']:.0f}M\t€{data['free_cash_flow']:.0f}M")
+        if self.verbose:
+            print(f"\nOperating Model Summary (€M):")
+            print("-" * 50)
+            print("Year\tRevenue\tEBITDA\tFree CF")
+            for year, data in model.iterrows():
+                print(f"{year}\t€{data['revenue']:.0f}M\t€{data['ebitda']:.0f}M\t€{data['free_cash_flow']:.0f}M")
         
         return model
     
@@ -192,55 +376,33 @@ class LBOAnalysis:
         """
         Model debt amortization and paydown schedule
         """
-        if not self.debt_structure or not self.operating_model:
+        if not self.debt_structure or self.operating_model.empty:
             print("Error: Need both debt structure and operating model")
             return None
         
-        schedule = {}
-        years = [1, 2, 3, 4, 5]
+        fcf = self.operating_model['free_cash_flow'].to_numpy(dtype=float)
+        cascade = _debt_cascade(self.debt_amounts, self.debt_rates, self.debt_amortization, fcf)
         
-        # Initialize debt balances
-        debt_balances = {}
-        for tranche, terms in self.debt_structure.items():
-            debt_balances[tranche] = terms['amount']
+        # Total debt outstanding at the end of each year (index 0 = Year 1)
+        self.remaining_debt_by_year = cascade[:, :, -1].sum(axis=1)  # ending_balance
         
-        for year in years:
-            year_schedule = {}
-            free_cash_flow = self.operating_model[year]['free_cash_flow']
-            remaining_cash = free_cash_flow
-            
-            for tranche, terms in self.debt_structure.items():
-                beginning_balance = debt_balances[tranche]
-                
-                # Mandatory amortization
-                mandatory_payment = beginning_balance * terms['amortization']
-                mandatory_payment = min(mandatory_payment, beginning_balance)
-                
-                # Optional prepayment from excess cash (prioritize by seniority)
-                optional_payment = 0
-                if remaining_cash > mandatory_payment and tranche == 'Term Loan B':
-                    # Use excess cash for TLB prepayment
-                    available_cash = remaining_cash - mandatory_payment
-                    optional_payment = min(available_cash, beginning_balance - mandatory_payment)
-                
-                total_payment = mandatory_payment + optional_payment
-                ending_balance = max(0, beginning_balance - total_payment)
-                interest_payment = beginning_balance * terms['rate']
-                
-                year_schedule[tranche] = {
-                    'beginning_balance': beginning_balance,
-                    'mandatory_payment': mandatory_payment,
-                    'optional_payment': optional_payment,
-                    'total_payment': total_payment,
-                    'interest_payment': interest_payment,
-                    'ending_balance': ending_balance
-                }
-                
-                # Update remaining cash and debt balance
-                remaining_cash -= total_payment
-                debt_balances[tranche] = ending_balance
-            
-            schedule[year] = year_schedule
+        # Same schedule as one float64 table indexed by (year, tranche), for export
+        n_years, n_tranches, n_fields = cascade.shape
+        self.debt_schedule_frame = pd.DataFrame(
+            cascade.reshape(n_years * n_tranches, n_fields),
+            index=pd.MultiIndex.from_product(
+                [self._YEARS.tolist(), self.debt_tranche_names], names=['year', 'tranche']
+            ),
+            columns=DEBT_SCHEDULE_FIELDS
+        )
+        
+        schedule = {
+            year: {
+                tranche: dict(zip(DEBT_SCHEDULE_FIELDS, cascade[year - 1, t].tolist()))
+                for t, tranche in enumerate(self.debt_tranche_names)
+            }
+            for year in self._YEARS.tolist()
+        }
         
         self.debt_schedule = schedule
         return schedule
@@ -256,43 +418,51 @@ class LBOAnalysis:
         if exit_multiples is None:
             exit_multiples = [8.0, 9.0, 10.0, 11.0, 12.0]
         
-        if not self.operating_model or not self.debt_schedule:
+        exit_year = int(exit_year)  # used as a position into the yearly arrays
+        
+        if self.operating_model.empty or not self.debt_schedule:
             print("Error: Need operating model and debt schedule")
             return None
         
-        exit_ebitda = self.operating_model[exit_year]['ebitda']
+        exit_ebitda = self.operating_model.loc[exit_year, 'ebitda']
         
         # Calculate remaining debt at exit
-        total_remaining_debt = 0
-        for tranche in self.debt_schedule[exit_year].values():
-            total_remaining_debt += tranche['ending_balance']
-        
-        results = {}
-        
-        print(f"\nExit Analysis - Year {exit_year}")
-        print(f"Exit EBITDA: €{exit_ebitda:.0f}M")
-        print(f"Remaining Debt: €{total_remaining_debt:.0f}M")
-        print("-" * 50)
-        
-        for multiple in exit_multiples:
-            # Calculate enterprise and equity value
-            enterprise_value = exit_ebitda * multiple
-            equity_value = max(0, enterprise_value - total_remaining_debt)
-            
-            # Calculate returns
-            moic = equity_value / self.sponsor_equity if self.sponsor_equity > 0 else 0
-            irr = (moic ** (1/exit_year)) - 1 if moic > 0 else -1
-            
-            results[f"{multiple:.1f}x"] = {
+        total_remaining_debt = self.remaining_debt_by_year[exit_year - 1]
+        
+        # Calculate enterprise and equity value for every multiple at once
+        multiples = np.asarray(exit_multiples, dtype=float)
+        enterprise_value = exit_ebitda * multiples
+        equity_value = np.maximum(0.0, enterprise_value - total_remaining_debt)
+        
+        # Calculate returns
+        if self.sponsor_equity > 0:
+            moic = equity_value / self.sponsor_equity
+        else:
+            moic = np.zeros_like(equity_value)
+        irr = np.where(moic > 0, moic ** (1/exit_year) - 1, -1.0)
+        
+        results = {
+            f"{multiple:.1f}x": {
                 'exit_multiple': multiple,
-                'enterprise_value': enterprise_value,
-                'remaining_debt': total_remaining_debt,
-                'equity_value': equity_value,
-                'moic': moic,
-                'irr': irr
+                'enterprise_value': ev,
+                'remaining_debt': float(total_remaining_debt),
+                'equity_value': equity,
+                'moic': m,
+                'irr': r
             }
-            
-            print(f"{multiple:.1f}x Multiple: €{equity_value:.0f}M equity, {moic:.1f}x MOIC, {irr:.1%} IRR")
+            for multiple, ev, equity, m, r in zip(
+                multiples.tolist(), enterprise_value.tolist(), equity_value.tolist(),
+                moic.tolist(), irr.tolist()
+            )
+        }
+        
+        if self.verbose:
+            print(f"\nExit Analysis - Year {exit_year}")
+            print(f"Exit EBITDA: €{exit_ebitda:.0f}M")
+            print(f"Remaining Debt: €{total_remaining_debt:.0f}M")
+            print("-" * 50)
+            for multiple, equity, m, r in zip(exit_multiples, equity_value, moic, irr):
+                print(f"{multiple:.1f}x Multiple: €{equity:.0f}M equity, {m:.1f}x MOIC, {r:.1%} IRR")
         
         self.returns_analysis = results
         return results
@@ -307,43 +477,129 @@ class LBOAnalysis:
             return None
         
         base_case = self.returns_analysis['10.0x']  # Use 10x multiple as base
-        sensitivity_grid = []
-        
-        for rev_adj in revenue_sensitivity:
-            for ebitda_adj in ebitda_sensitivity:
-                # Adjust base case EBITDA
-                adjusted_ebitda = self.operating_model[5]['ebitda'] * (1 + rev_adj) * (1 + ebitda_adj)
-                
-                # Recalculate returns
-                enterprise_value = adjusted_ebitda * 10.0
-                remaining_debt = base_case['remaining_debt']
-                equity_value = max(0, enterprise_value - remaining_debt)
-                moic = equity_value / self.sponsor_equity
-                irr = (moic ** (1/5)) - 1 if moic > 0 else -1
-                
-                sensitivity_grid.append({
-                    'revenue_adj': rev_adj,
-                    'ebitda_adj': ebitda_adj, 
-                    'irr': irr,
-                    'moic': moic
-                })
-        
-        return pd.DataFrame(sensitivity_grid)
+        rev = np.asarray(revenue_sensitivity, dtype=float)
+        ebit = np.asarray(ebitda_sensitivity, dtype=float)
+        
+        # Display-only grid: evaluate in float32 to halve memory traffic (float literals
+        # would promote numexpr kernels to float64, so constants are passed as float32)
+        rev_adj = rev.astype(np.float32)
+        ebit_adj = ebit.astype(np.float32)
+        base_ebitda = np.float32(self.operating_model.loc[5, 'ebitda'])
+        remaining_debt = np.float32(base_case['remaining_debt'])
+        sponsor_equity = np.float32(self.sponsor_equity)
+        
+        if numexpr is not None and rev.size * ebit.size >= NUMEXPR_MIN_CELLS:
+            # Large grids: fused, multi-threaded evaluation without full-size temporaries
+            excess_value = numexpr.evaluate(
+                "base_ebitda * (1 + rev) * (1 + ebit) * multiple - remaining_debt",
+                local_dict={'base_ebitda': base_ebitda, 'rev': rev_adj[:, None], 'ebit': ebit_adj[None, :],
+                            'multiple': np.float32(10.0), 'remaining_debt': remaining_debt}
+            )
+            moic = numexpr.evaluate(
+                "where(excess_value > 0, excess_value, 0) / sponsor_equity",
+                local_dict={'excess_value': excess_value, 'sponsor_equity': sponsor_equity}
+            )
+            irr = numexpr.evaluate(
+                "where(moic > 0, moic ** exponent - 1, -1)",
+                local_dict={'moic': moic, 'exponent': np.float32(1/5)}
+            )
+        else:
+            # Adjust base case EBITDA across the full grid (rows: revenue, cols: EBITDA)
+            adjusted_ebitda = base_ebitda * (1 + rev_adj[:, None]) * (1 + ebit_adj[None, :])
+            
+            # Recalculate returns
+            enterprise_value = adjusted_ebitda * np.float32(10.0)
+            equity_value = np.maximum(np.float32(0), enterprise_value - remaining_debt)
+            moic = equity_value / sponsor_equity
+            irr = np.where(moic > 0, moic ** np.float32(1/5) - 1, np.float32(-1))
+        
+        return pd.DataFrame({
+            'revenue_adj': np.repeat(rev, len(ebit)),
+            'ebitda_adj': np.tile(ebit, len(rev)),
+            'irr': irr.ravel(),
+            'moic': moic.ravel()
+        })
+    
+    @classmethod
+    def run_batch(cls, params, exit_multiples=None, exit_year=5):
+        """
+        Evaluate many LBO scenarios at once as (scenarios, years) arrays
+        
+        Parameters:
+        params (DataFrame): One row per scenario with columns sponsor_equity,
+            base_revenue, growth_y2, growth_y3, growth_y4, growth_y5,
+            ebitda_margin, term_loan_a, term_loan_b, revolver, subordinated and
+            optionally capex_rate, nwc_rate, tax_rate
+        exit_multiples (list): EV/EBITDA exit multiples to analyze
+        exit_year (int): Exit year for analysis
+        
+        Returns a DataFrame with one row per scenario and exit multiple
+        """
+        if exit_multiples is None:
+            exit_multiples = [8.0, 9.0, 10.0, 11.0, 12.0]
+        
+        exit_year = int(exit_year)  # used as a position into the yearly arrays
+        
+        # Same defaults as build_operating_model
+        defaults = {'capex_rate': 0.03, 'nwc_rate': 0.02, 'tax_rate': 0.25}
+        params = params.assign(**{k: v for k, v in defaults.items() if k not in params})
+        
+        def column(name):
+            return params[name].to_numpy(dtype=float)
+        
+        def columns(names):
+            return np.ascontiguousarray(params[names].to_numpy(dtype=float))
+        
+        n_scenarios = len(params)
+        multiples = np.asarray(exit_multiples, dtype=float)
+        amounts = columns(['term_loan_a', 'term_loan_b', 'revolver', 'subordinated'])
+        growth = columns(['growth_y2', 'growth_y3', 'growth_y4', 'growth_y5'])
+        
+        # Operating model for every scenario
+        revenue = column('base_revenue')[:, None] * np.concatenate(
+            (np.ones((n_scenarios, 1)), np.cumprod(1 + growth, axis=1)), axis=1
+        )
+        values = _operating(
+            revenue, column('ebitda_margin'), column('capex_rate'), column('nwc_rate'),
+            column('tax_rate'), amounts @ cls._TRANCHE_RATES
+        )
+        free_cash_flow = values[OPERATING_METRICS.index('free_cash_flow')]
+        exit_ebitda = np.ascontiguousarray(values[OPERATING_METRICS.index('ebitda')][:, exit_year - 1])
+        
+        # Debt cascade and returns
+        remaining_debt, moic, irr = _batch_lbo_kernel(
+            amounts, cls._TRANCHE_RATES, cls._TRANCHE_AMORTIZATION, free_cash_flow,
+            exit_ebitda, column('sponsor_equity'), multiples, exit_year
+        )
+        
+        n_multiples = len(multiples)
+        return pd.DataFrame({
+            'scenario': np.repeat(params.index.to_numpy(), n_multiples),
+            'exit_multiple': np.tile(multiples, n_scenarios),
+            'exit_ebitda': np.repeat(exit_ebitda, n_multiples),
+            'remaining_debt': np.repeat(remaining_debt, n_multiples),
+            'moic': moic.ravel(),
+            'irr': irr.ravel()
+        })
     
     def create_visualizations(self):
         """
         Create professional charts for LBO analysis
         """
-        if not self.debt_schedule or not self.operating_model:
+        # Plotly is imported here so modelling and export runs don't pay for it
+        import plotly.graph_objects as go
+        import plotly.express as px
+        
+        if not self.debt_schedule or self.operating_model.empty:
             print("Error: Need complete financial model")
             return None
         
         # 1. Debt Paydown Waterfall
         fig_debt = go.Figure()
         
-        years = list(range(1, 6))
-        for tranche in ['Term Loan A', 'Term Loan B', 'Revolver', 'Subordinated Debt']:
-            if self.debt_structure[tranche]['amount'] > 0:
+        years = self._YEARS.tolist()
+        for t, tranche in enumerate(self.debt_tranche_names):
+            if self.debt_amounts[t] > 0:
                 balances = [self.debt_schedule[year][tranche]['ending_balance'] for year in years]
                 fig_debt.add_trace(go.Scatter(
                     x=years,
@@ -362,30 +618,23 @@ class LBOAnalysis:
         
         # 2. Returns Heatmap
         if self.returns_analysis:
-            multiples = list(range(8, 13))
-            years = list(range(3, 8))
-            irr_matrix = []
+            multiples = np.arange(8, 13, dtype=np.float32)
+            years = np.arange(3, 8)
+            
+            # Simplified IRR calculation for different scenarios (exits after Year 5 use Year 5)
+            # Display-only matrix, so evaluated in float32
+            exit_idx = np.minimum(years, 5) - 1
+            exit_ebitda = self.operating_model['ebitda'].to_numpy(dtype=np.float32)[exit_idx]
+            remaining_debt = self.remaining_debt_by_year[exit_idx].astype(np.float32)
             
-            for year in years:
-                row = []
-                for multiple in multiples:
-                    # Simplified IRR calculation for different scenarios
-                    exit_ebitda = self.operating_model[min(year, 5)]['ebitda']
-                    enterprise_value = exit_ebitda * multiple
-                    remaining_debt = sum([
-                        self.debt_schedule[min(year, 5)][tranche]['ending_balance'] 
-                        for tranche in self.debt_structure.keys()
-                        if self.debt_structure[tranche]['amount'] > 0
-                    ])
-                    equity_value = max(0, enterprise_value - remaining_debt)
-                    moic = equity_value / self.sponsor_equity
-                    irr = (moic ** (1/year)) - 1 if moic > 0 else -1
-                    row.append(irr)
-                irr_matrix.append(row)
+            enterprise_value = exit_ebitda[:, None] * multiples[None, :]
+            equity_value = np.maximum(np.float32(0), enterprise_value - remaining_debt[:, None])
+            moic = equity_value / np.float32(self.sponsor_equity)
+            irr_matrix = np.where(moic > 0, moic ** (1 / years[:, None]).astype(np.float32) - 1, np.float32(-1))
             
             fig_heatmap = px.imshow(
                 irr_matrix,
-                x=[f"{m}x" for m in multiples],
+                x=[f"{m:.0f}x" for m in multiples],
                 y=[f"Year {y}" for y in years],
                 color_continuous_scale='RdYlGn',
                 title=f"{self.company_name} - IRR Sensitivity Analysis",
@@ -394,39 +643,73 @@ class LBOAnalysis:
         
         return fig_debt, fig_heatmap
     
+    def _summary_table(self):
+        """
+        Transaction summary table used by the exports
+        """
+        summary_data = {
+            'Metric': ['Purchase Price', 'Sponsor Equity', 'Total Debt', 'Debt/Equity'],
+            'Value (€M)': [self.purchase_price, self.sponsor_equity, 
+                          self.total_debt, self.total_debt/self.sponsor_equity]
+        }
+        return pd.DataFrame(summary_data)
+    
+    def _model_tables(self):
+        """
+        Operating model, debt schedule and returns tables used by the exports
+        
+        The debt schedule is the single (year, tranche) table from model_debt_schedule
+        """
+        tables = {}
+        
+        # Operating model
+        if not self.operating_model.empty:
+            tables['Operating Model'] = self.operating_model
+        
+        # Debt schedule
+        if self.debt_schedule:
+            tables['Debt Schedule'] = self.debt_schedule_frame
+        
+        # Returns analysis
+        if self.returns_analysis:
+            tables['Returns Analysis'] = pd.DataFrame(self.returns_analysis).T
+        
+        return tables
+    
     def export_to_excel(self, filename=None):
         """
         Export complete LBO model to Excel
+        
+        For batch runs prefer export_to_parquet, which skips Excel's XML serialization
         """
         if filename is None:
             filename = f"{self.company_name.replace(' ', '_')}_LBO_Model.xlsx"
         
         with pd.ExcelWriter(filename, engine='xlsxwriter') as writer:
-            # Transaction summary
-            summary_data = {
-                'Metric': ['Purchase Price', 'Sponsor Equity', 'Total Debt', 'Debt/Equity'],
-                'Value (€M)': [self.purchase_price, self.sponsor_equity, 
-                              self.total_debt, self.total_debt/self.sponsor_equity]
-            }
-            pd.DataFrame(summary_data).to_excel(writer, sheet_name='Transaction Summary', index=False)
-            
-            # Operating model
-            if self.operating_model:
-                operating_df = pd.DataFrame(self.operating_model).T
-                operating_df.to_excel(writer, sheet_name='Operating Model')
-            
-            # Debt schedule
-            if self.debt_schedule:
-                for year in [1, 2, 3, 4, 5]:
-                    debt_df = pd.DataFrame(self.debt_schedule[year]).T
-                    debt_df.to_excel(writer, sheet_name=f'Debt Schedule Y{year}')
-            
-            # Returns analysis
-            if self.returns_analysis:
-                returns_df = pd.DataFrame(self.returns_analysis).T
-                returns_df.to_excel(writer, sheet_name='Returns Analysis')
+            self._summary_table().to_excel(writer, sheet_name='Transaction Summary', index=False)
+            for sheet_name, table in self._model_tables().items():
+                table.to_excel(writer, sheet_name=sheet_name)
+        
+        if self.verbose:
+            print(f"Model exported to {filename}")
+    
+    def export_to_parquet(self, path=None):
+        """
+        Export complete LBO model as Parquet files, one per table
+        
+        Parameters:
+        path (str): Output directory, created if missing
+        """
+        if path is None:
+            path = f"{self.company_name.replace(' ', '_')}_LBO_Model"
+        os.makedirs(path, exist_ok=True)
+        
+        self._summary_table().to_parquet(os.path.join(path, 'transaction_summary.parquet'), index=False)
+        for table_name, table in self._model_tables().items():
+            table.to_parquet(os.path.join(path, f"{table_name.lower().replace(' ', '_')}.parquet"))
         
-        print(f"Model exported to {filename}")
+        if self.verbose:
+            print(f"Model exported to {path}")
 
 # Example usage and demonstration
 if __name__ == "__main__":